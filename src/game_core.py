@@ -1,14 +1,24 @@
 import random
-from typing import List, Dict, Tuple, Optional
-from dataclasses import dataclass
-from enum import Enum, auto
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, NamedTuple, Tuple, Optional
+from dataclasses import dataclass, field
+from enum import Enum, IntEnum, auto
+
+NUM_ROUNDS = 6  # Rounds per battle
 
 class PillzType(Enum):
     NONE = auto()
     SOUTH_PACIFIC = auto()
     NORDIC_SHIELD = auto()
 
-@dataclass
+class MoveOutcome(IntEnum):
+    """Result of pitting two moves against each other"""
+    DRAW = 0
+    MOVE1_WINS = 1
+    MOVE2_WINS = 2
+    NO_EFFECT = 3
+
+@dataclass(frozen=True, slots=True)
 class PillzEffect:
     """Represents the effect of a pillz on a fighter"""
     name: str
@@ -18,75 +28,134 @@ class PillzEffect:
     next_round_damage_multiplier: float = 1.0
     next_round_resistance_multiplier: float = 1.0
 
+# Pillz effects are static data, so every fighter shares one instance per type
+_PILLZ_EFFECTS: Dict[PillzType, PillzEffect] = {
+    PillzType.NONE: PillzEffect(name="None"),
+    PillzType.SOUTH_PACIFIC: PillzEffect(
+        name="South Pacific",
+        damage_multiplier=0,  # Skip this round
+        skip_round=True,
+        next_round_damage_multiplier=2.0  # Double damage next round
+    ),
+    PillzType.NORDIC_SHIELD: PillzEffect(
+        name="Nordic Shield",
+        resistance_multiplier=2.0,  # Double resistance this round
+        next_round_resistance_multiplier=0  # No resistance next round
+    ),
+}
+
+def _carry_over_effect(effect: PillzEffect) -> Optional[PillzEffect]:
+    """Build the "(Next Round)" effect a pillz leaves behind, if any"""
+    if effect.next_round_damage_multiplier != 1.0:
+        return PillzEffect(
+            name=f"{effect.name} (Next Round)",
+            damage_multiplier=effect.next_round_damage_multiplier
+        )
+    elif effect.next_round_resistance_multiplier != 1.0:
+        return PillzEffect(
+            name=f"{effect.name} (Next Round)",
+            resistance_multiplier=effect.next_round_resistance_multiplier
+        )
+    return None
+
+# Effect each pillz type leaves for the round after it is taken
+_NEXT_ROUND_EFFECTS: Dict[PillzType, Optional[PillzEffect]] = {
+    pillz_type: _carry_over_effect(effect) for pillz_type, effect in _PILLZ_EFFECTS.items()
+}
+
 class Pillz:
     """Defines all available pillz and their effects"""
     @staticmethod
     def get_effect(pillz_type: PillzType) -> PillzEffect:
-        if pillz_type == PillzType.SOUTH_PACIFIC:
-            return PillzEffect(
-                name="South Pacific",
-                damage_multiplier=0,  # Skip this round
-                skip_round=True,
-                next_round_damage_multiplier=2.0  # Double damage next round
-            )
-        elif pillz_type == PillzType.NORDIC_SHIELD:
-            return PillzEffect(
-                name="Nordic Shield",
-                resistance_multiplier=2.0,  # Double resistance this round
-                next_round_resistance_multiplier=0  # No resistance next round
-            )
-        return PillzEffect(name="None")
+        return _PILLZ_EFFECTS.get(pillz_type, _PILLZ_EFFECTS[PillzType.NONE])
+    
+    @staticmethod
+    def get_next_round_effect(pillz_type: PillzType) -> Optional[PillzEffect]:
+        """Effect carried into the round after the pillz is taken, if any"""
+        return _NEXT_ROUND_EFFECTS.get(pillz_type)
 
-@dataclass
+@dataclass(slots=True)
 class Fighter:
     name: str
     damage: int
     resistance: int
     health: float = 100
     initial_health: float = 100
+    # Set through apply_pillz, update_effects or reset (or the constructor), which
+    # keep the cached values below in sync; assigning it directly leaves them stale
     current_effect: Optional[PillzEffect] = None
     next_round_effect: Optional[PillzEffect] = None
+    # Copies of current_effect's values so the round loop needn't dereference it;
+    # written only by _set_effect
+    _damage_multiplier: float = field(default=1.0, init=False, repr=False, compare=False)
+    _resistance_multiplier: float = field(default=1.0, init=False, repr=False, compare=False)
+    _skip_round: bool = field(default=False, init=False, repr=False, compare=False)
+    _effect_name: str = field(default='None', init=False, repr=False, compare=False)
+    _carry_over: Optional[PillzEffect] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self._set_effect(self.current_effect)
     
     def calculate_damage(self, opponent: 'Fighter') -> float:
         """Calculate effective damage considering opponent's resistance and pillz effects"""
-        damage_multiplier = 1.0
-        if self.current_effect:
-            damage_multiplier *= self.current_effect.damage_multiplier
-        
-        base_damage = self.damage * damage_multiplier
+        resisted = opponent.resistance * opponent._resistance_multiplier / 100
+        if resisted > 1.0:
+            resisted = 1.0
+        return self.damage * self._damage_multiplier * (1.0 - resisted)
+    
+    def take_damage(self, damage: float):
+        """Reduce health by the given damage, saturating at zero"""
+        health = self.health - damage
+        self.health = health if health > 0 else 0
+    
+    def _set_effect(self, effect: Optional[PillzEffect],
+                    carry_over: Optional[PillzEffect] = None):
+        """Make effect the current one and cache its values on the fighter
         
-        opponent_resistance = opponent.resistance
-        if opponent.current_effect:
-            opponent_resistance *= opponent.current_effect.resistance_multiplier
-            
-        return base_damage * (1 - min(opponent_resistance/100, 1))
+        carry_over is the effect it leaves for the next round; it is worked out
+        from effect's next-round multipliers when not passed in.
+        """
+        self.current_effect = effect
+        if effect:
+            self._damage_multiplier = effect.damage_multiplier
+            self._resistance_multiplier = effect.resistance_multiplier
+            self._skip_round = effect.skip_round
+            self._effect_name = effect.name
+            self._carry_over = carry_over or _carry_over_effect(effect)
+        else:
+            self._damage_multiplier = 1.0
+            self._resistance_multiplier = 1.0
+            self._skip_round = False
+            self._effect_name = 'None'
+            self._carry_over = None
     
     def apply_pillz(self, pillz_type: PillzType):
         """Apply a pillz effect to the fighter"""
-        self.current_effect = Pillz.get_effect(pillz_type)
+        self._set_effect(Pillz.get_effect(pillz_type), Pillz.get_next_round_effect(pillz_type))
     
     def update_effects(self):
         """Update effects after each round"""
-        if self.current_effect and self.current_effect.next_round_damage_multiplier != 1.0:
-            self.next_round_effect = PillzEffect(
-                name=f"{self.current_effect.name} (Next Round)",
-                damage_multiplier=self.current_effect.next_round_damage_multiplier
-            )
-        elif self.current_effect and self.current_effect.next_round_resistance_multiplier != 1.0:
-            self.next_round_effect = PillzEffect(
-                name=f"{self.current_effect.name} (Next Round)",
-                resistance_multiplier=self.current_effect.next_round_resistance_multiplier
-            )
-        
-        self.current_effect = self.next_round_effect
+        carry_over = self._carry_over
+        self._set_effect(carry_over if carry_over else self.next_round_effect)
         self.next_round_effect = None
     
     def reset(self):
         """Reset fighter's health and effects"""
         self.health = self.initial_health
-        self.current_effect = None
+        self._set_effect(None)
         self.next_round_effect = None
 
+class RoundLog(NamedTuple):
+    """Record of a single simulated round; use _asdict() for a dict view"""
+    round: int
+    move1: str
+    move2: str
+    fighter1_effect: str
+    fighter2_effect: str
+    result: str
+    fighter1_health: float
+    fighter2_health: float
+
 class BattleSystem:
     def __init__(self):
         self.move_relationships = {
@@ -96,95 +165,172 @@ class BattleSystem:
             'Guard': ['Rush', 'Strike'],
             'Grapple': ['Rush', 'Guard']
         }
-        self.moves = list(self.move_relationships.keys())
+        self.moves = tuple(self.move_relationships)
+        # Moves are handled as integer ids (their index in self.moves); bit j of
+        # win_mask[i] is set when move i beats move j
+        move_ids = {move: i for i, move in enumerate(self.moves)}
+        self._move_ids = tuple(move_ids.values())
+        self.win_mask = tuple(
+            sum(1 << move_ids[beaten] for beaten in self.move_relationships[move])
+            for move in self.moves
+        )
+        # Outcome of every ordered move pair, packed two bits per pair into one int
+        self._outcomes = 0
+        for move1 in self._move_ids:
+            for move2 in self._move_ids:
+                if move1 == move2:
+                    outcome = MoveOutcome.DRAW
+                elif self.does_move_win(move1, move2):
+                    outcome = MoveOutcome.MOVE1_WINS
+                elif self.does_move_win(move2, move1):
+                    outcome = MoveOutcome.MOVE2_WINS
+                else:
+                    outcome = MoveOutcome.NO_EFFECT
+                self._outcomes |= outcome << (2 * (move1 * len(self.moves) + move2))
+        self._result_cache: Dict[Tuple[str, str], Tuple[str, ...]] = {}
+        self._skip_result_cache: Dict[Tuple[str, str], str] = {}
     
-    def does_move_win(self, move1: str, move2: str) -> bool:
-        return move2 in self.move_relationships[move1]
+    def does_move_win(self, move1: int, move2: int) -> bool:
+        return bool((self.win_mask[move1] >> move2) & 1)
     
-    def simulate_single_battle(self, fighter1: Fighter, fighter2: Fighter) -> List[Dict]:
+    def _result_strings(self, fighter1: Fighter, fighter2: Fighter) -> Tuple[str, ...]:
+        """Round result strings for a pairing, indexed by MoveOutcome"""
+        key = (fighter1.name, fighter2.name)
+        results = self._result_cache.get(key)
+        if results is None:
+            results = self._result_cache[key] = (
+                'Draw', f'{fighter1.name} wins', f'{fighter2.name} wins', 'No effect'
+            )
+        return results
+    
+    def _skip_result(self, winner: Fighter, skipper_effect: PillzEffect) -> str:
+        """Round result string for a win against an opponent skipping the round"""
+        key = (winner.name, skipper_effect.name)
+        result = self._skip_result_cache.get(key)
+        if result is None:
+            result = self._skip_result_cache[key] = (
+                f'{winner.name} wins (Opponent used {skipper_effect.name})'
+            )
+        return result
+    
+    def simulate_single_battle(self, fighter1: Fighter, fighter2: Fighter,
+                               record: bool = True) -> List[RoundLog]:
+        """Simulate one battle; the round log is left empty unless record is set"""
         battle_log = []
         
-        for round_num in range(1, 7):
+        # Bind per-round lookups to locals outside the round loop
+        moves = self.moves
+        num_moves = len(moves)
+        outcomes = self._outcomes
+        results = self._result_strings(fighter1, fighter2)
+        skip_result = self._skip_result
+        log_round = battle_log.append
+        move1_wins = MoveOutcome.MOVE1_WINS
+        move2_wins = MoveOutcome.MOVE2_WINS
+        
+        # Draw all of the battle's random values up front
+        move_ids = self._move_ids
+        rand = random.random
+        pillz_rolls1 = [rand() for _ in range(NUM_ROUNDS)]
+        pillz_rolls2 = [rand() for _ in range(NUM_ROUNDS)]
+        moves1 = random.choices(move_ids, k=NUM_ROUNDS)
+        moves2 = random.choices(move_ids, k=NUM_ROUNDS)
+        rounds = zip(range(1, NUM_ROUNDS + 1), pillz_rolls1, pillz_rolls2, moves1, moves2)
+        
+        for round_num, roll1, roll2, move1, move2 in rounds:
             # Randomly decide if fighters use pillz (for simulation purposes)
-            if random.random() < 0.2:  # 20% chance to use South Pacific
+            if roll1 < 0.2:  # 20% chance to use South Pacific
                 fighter1.apply_pillz(PillzType.SOUTH_PACIFIC)
-            if random.random() < 0.2:  # 20% chance to use Nordic Shield
+            if roll2 < 0.2:  # 20% chance to use Nordic Shield
                 fighter2.apply_pillz(PillzType.NORDIC_SHIELD)
             
-            move1 = random.choice(self.moves)
-            move2 = random.choice(self.moves)
-            
             # Check if either fighter is skipping due to pillz effect
-            fighter1_skip = fighter1.current_effect and fighter1.current_effect.skip_round
-            fighter2_skip = fighter2.current_effect and fighter2.current_effect.skip_round
+            fighter1_skip = fighter1._skip_round
+            fighter2_skip = fighter2._skip_round
             
             if fighter1_skip and fighter2_skip:
                 round_result = 'Both fighters skip (Pillz effect)'
             elif fighter1_skip:
-                round_result = f'{fighter2.name} wins (Opponent used {fighter1.current_effect.name})'
-                damage = fighter2.calculate_damage(fighter1)
-                fighter1.health -= damage
+                round_result = skip_result(fighter2, fighter1.current_effect)
+                fighter1.take_damage(fighter2.calculate_damage(fighter1))
             elif fighter2_skip:
-                round_result = f'{fighter1.name} wins (Opponent used {fighter2.current_effect.name})'
-                damage = fighter1.calculate_damage(fighter2)
-                fighter2.health -= damage
+                round_result = skip_result(fighter1, fighter2.current_effect)
+                fighter2.take_damage(fighter1.calculate_damage(fighter2))
             else:
-                if move1 == move2:
-                    round_result = 'Draw'
-                elif self.does_move_win(move1, move2):
-                    damage = fighter1.calculate_damage(fighter2)
-                    fighter2.health -= damage
-                    round_result = f'{fighter1.name} wins'
-                elif self.does_move_win(move2, move1):
-                    damage = fighter2.calculate_damage(fighter1)
-                    fighter1.health -= damage
-                    round_result = f'{fighter2.name} wins'
-                else:
-                    round_result = 'No effect'
+                # Two-bit outcome of the move pair, packed in __init__
+                outcome = (outcomes >> (2 * (move1 * num_moves + move2))) & 3
+                round_result = results[outcome]
+                if outcome == move1_wins:
+                    fighter2.take_damage(fighter1.calculate_damage(fighter2))
+                elif outcome == move2_wins:
+                    fighter1.take_damage(fighter2.calculate_damage(fighter1))
             
             # Record round results
-            battle_log.append({
-                'round': round_num,
-                'move1': move1,
-                'move2': move2,
-                'fighter1_effect': fighter1.current_effect.name if fighter1.current_effect else 'None',
-                'fighter2_effect': fighter2.current_effect.name if fighter2.current_effect else 'None',
-                'result': round_result,
-                'fighter1_health': max(0, fighter1.health),
-                'fighter2_health': max(0, fighter2.health)
-            })
+            if record:
+                log_round(RoundLog(
+                    round_num,
+                    moves[move1],
+                    moves[move2],
+                    fighter1._effect_name,
+                    fighter2._effect_name,
+                    round_result,
+                    fighter1.health,
+                    fighter2.health
+                ))
             
             # Update effects for next round
             fighter1.update_effects()
             fighter2.update_effects()
         
         return battle_log
+    
+    def simulate_batch(self, fighter1: Fighter, fighter2: Fighter,
+                       num_battles: int) -> Tuple[int, int, int]:
+        """Run independent battles and count fighter1 wins, fighter2 wins and draws"""
+        fighter1_wins = 0
+        fighter2_wins = 0
+        draws = 0
+        
+        for _ in range(num_battles):
+            fighter1.reset()
+            fighter2.reset()
+            
+            self.simulate_single_battle(fighter1, fighter2, record=False)
+            final_health1 = fighter1.health
+            final_health2 = fighter2.health
+            
+            if final_health1 > final_health2:
+                fighter1_wins += 1
+            elif final_health2 > final_health1:
+                fighter2_wins += 1
+            else:
+                draws += 1
+        
+        return fighter1_wins, fighter2_wins, draws
+
+def _run_battle_simulation_worker(num_simulations: int, seed: int) -> Tuple[int, int, int]:
+    """Process-pool entry point; seeded by the parent so forked workers don't share its RNG state"""
+    random.seed(seed)
+    return run_battle_simulation(num_simulations)
 
-def run_battle_simulation(num_simulations: int = 1000) -> Tuple[int, int, int]:
+def run_battle_simulation(num_simulations: int = 1000, workers: int = 1) -> Tuple[int, int, int]:
+    """Count wins and draws over independent battles, optionally split across processes"""
+    workers = min(workers, num_simulations)  # No empty chunks or idle processes
+    if workers > 1:
+        chunks = [num_simulations // workers + (i < num_simulations % workers)
+                  for i in range(workers)]
+        # Seeds come from the parent's RNG so a seeded run is reproducible
+        seeds = [random.getrandbits(64) for _ in chunks]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_run_battle_simulation_worker, chunks, seeds))
+        fighter1_wins, fighter2_wins, draws = (sum(counts) for counts in zip(*results))
+        return fighter1_wins, fighter2_wins, draws
+    
     battle_system = BattleSystem()
     fighter1 = Fighter("HighDamage Fighter", damage=30, resistance=20)
     fighter2 = Fighter("HighResistance Fighter", damage=20, resistance=30)
     
-    fighter1_wins = 0
-    fighter2_wins = 0
-    draws = 0
-    
-    for _ in range(num_simulations):
-        fighter1.reset()
-        fighter2.reset()
-        
-        battle_log = battle_system.simulate_single_battle(fighter1, fighter2)
-        final_health1 = battle_log[-1]['fighter1_health']
-        final_health2 = battle_log[-1]['fighter2_health']
-        
-        if final_health1 > final_health2:
-            fighter1_wins += 1
-        elif final_health2 > final_health1:
-            fighter2_wins += 1
-        else:
-            draws += 1
-    
-    return fighter1_wins, fighter2_wins, draws
+    return battle_system.simulate_batch(fighter1, fighter2, num_simulations)
 
 def print_example_battle():
     battle_system = BattleSystem()
@@ -195,13 +341,13 @@ def print_example_battle():
     
     print("\nExample Battle with Pillz Effects:")
     for round_data in battle_log:
-        print(f"\nRound {round_data['round']}:")
-        print(f"Effects - {fighter1.name}: {round_data['fighter1_effect']}, "
-              f"{fighter2.name}: {round_data['fighter2_effect']}")
-        print(f"{fighter1.name} uses {round_data['move1']} vs {fighter2.name} uses {round_data['move2']}")
-        print(f"Result: {round_data['result']}")
-        print(f"Health - {fighter1.name}: {round_data['fighter1_health']:.1f}, "
-              f"{fighter2.name}: {round_data['fighter2_health']:.1f}")
+        print(f"\nRound {round_data.round}:")
+        print(f"Effects - {fighter1.name}: {round_data.fighter1_effect}, "
+              f"{fighter2.name}: {round_data.fighter2_effect}")
+        print(f"{fighter1.name} uses {round_data.move1} vs {fighter2.name} uses {round_data.move2}")
+        print(f"Result: {round_data.result}")
+        print(f"Health - {fighter1.name}: {round_data.fighter1_health:.1f}, "
+              f"{fighter2.name}: {round_data.fighter2_health:.1f}")
 
 if __name__ == "__main__":
     num_simulations = 1000
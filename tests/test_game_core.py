@@ -0,0 +1,90 @@
+import random
+from dataclasses import fields
+
+from src.game_core import (
+    BattleSystem, Fighter, MoveOutcome, Pillz, PillzType, run_battle_simulation
+)
+
+
+def test_apply_pillz_updates_damage():
+    attacker = Fighter("A", 30, 20)
+    defender = Fighter("B", 20, 30)
+    defender.apply_pillz(PillzType.NORDIC_SHIELD)
+    assert attacker.calculate_damage(defender) == 12.0
+
+
+def test_apply_pillz_updates_skip_round():
+    fighter = Fighter("B", 20, 30)
+    fighter.apply_pillz(PillzType.SOUTH_PACIFIC)
+    assert fighter._skip_round
+
+
+def test_cached_effect_values_are_not_compared():
+    compared = [f.name for f in fields(Fighter) if f.compare]
+    assert compared == ["name", "damage", "resistance", "health", "initial_health",
+                        "current_effect", "next_round_effect"]
+
+
+def test_current_effect_init_argument_is_applied():
+    attacker = Fighter("A", 30, 20)
+    defender = Fighter("B", 20, 30,
+                       current_effect=Pillz.get_effect(PillzType.NORDIC_SHIELD))
+    assert attacker.calculate_damage(defender) == 12.0
+
+
+def test_changing_resistance_updates_damage():
+    attacker = Fighter("A", 30, 20)
+    defender = Fighter("B", 20, 30)
+    defender.resistance = 90
+    assert attacker.calculate_damage(defender) == 30 * (1 - 90 / 100)
+
+
+def test_damage_matches_percentage_resistance():
+    # Dividing by 100 keeps results bit-identical for every percentage
+    for resistance in range(101):
+        attacker = Fighter("A", 30, 20)
+        defender = Fighter("B", 20, resistance)
+        assert attacker.calculate_damage(defender) == 30 * (1 - resistance / 100)
+
+
+def test_current_effect_set_directly_carries_over():
+    attacker = Fighter("A", 30, 20)
+    fighter = Fighter("B", 20, 30,
+                      current_effect=Pillz.get_effect(PillzType.SOUTH_PACIFIC))
+    fighter.update_effects()
+    assert fighter.current_effect.name == "South Pacific (Next Round)"
+    assert fighter.calculate_damage(attacker) == 32.0
+
+
+def test_parallel_counts_cover_every_battle():
+    assert sum(run_battle_simulation(101, workers=3)) == 101
+
+
+def test_seeded_parallel_run_repeats():
+    random.seed(1234)
+    first = run_battle_simulation(200, workers=2)
+    random.seed(1234)
+    assert run_battle_simulation(200, workers=2) == first
+
+
+def test_packed_outcomes_match_move_relationships():
+    battle_system = BattleSystem()
+    relationships = battle_system.move_relationships
+    moves = battle_system.moves
+    for i, move1 in enumerate(moves):
+        for j, move2 in enumerate(moves):
+            if move1 == move2:
+                expected = MoveOutcome.DRAW
+            elif move2 in relationships[move1]:
+                expected = MoveOutcome.MOVE1_WINS
+            elif move1 in relationships[move2]:
+                expected = MoveOutcome.MOVE2_WINS
+            else:
+                expected = MoveOutcome.NO_EFFECT
+            assert (battle_system._outcomes >> (2 * (i * len(moves) + j))) & 3 == expected
+            assert battle_system.does_move_win(i, j) == (move2 in relationships[move1])
+
+
+def test_more_workers_than_battles():
+    assert sum(run_battle_simulation(2, workers=4)) == 2
+    assert run_battle_simulation(0, workers=4) == (0, 0, 0)